@@ -19,7 +19,7 @@ CREATE TABLE players (
 -- games table
 CREATE TABLE games (
     game_id INTEGER PRIMARY KEY,
-    date DATE,
+    date INTEGER,  -- unix seconds (UTC midnight of the game date)
     home_team_id INTEGER,
     away_team_id INTEGER,
     home_score INTEGER,
@@ -29,6 +29,8 @@ CREATE TABLE games (
     FOREIGN KEY (away_team_id) REFERENCES teams(team_id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_games_date ON games(date);
+
 -- player_game_stats table
 CREATE TABLE player_game_stats (
     stat_id INTEGER PRIMARY KEY,
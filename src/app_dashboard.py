@@ -2,23 +2,31 @@
 # A minimal Dash app to visualize trends from your SQLite DB and demo a simple win-probability model.
 #
 # How to run:
-#   pip install dash plotly pandas scikit-learn sqlalchemy
+#   pip install "dash[diskcache]" plotly pandas pyarrow scikit-learn sqlalchemy
 #   python src/app_dashboard.py
 # Then open http://127.0.0.1:8050 in your browser.
 
+import hashlib
+import os
 import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import diskcache
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import roc_auc_score
 
-from dash import Dash, html, dcc, Input, Output, State
-import plotly.express as px
+from dash import Dash, DiskcacheManager, html, dcc, Input, Output, State, ClientsideFunction
+import plotly.graph_objects as go
 
-DB_PATH = Path("data/mlb_stats.db")
+from db import DB_PATH, migrate
+
+CACHE_DIR = Path("data/cache")  # derived frames as parquet, one set per DB state
 
 # ------------------------
 # Data access helpers
@@ -29,203 +37,347 @@ def get_conn():
         raise FileNotFoundError(f"Database not found at {DB_PATH}")
     return sqlite3.connect(DB_PATH)
 
-@pd.api.extensions.register_dataframe_accessor("roll")
-class _Roll:
-    def __init__(self, pandas_obj):
-        self._obj = pandas_obj
-    def winpct(self, window=10):
-        # expects columns: wins (0/1) ordered by date per team
-        s = self._obj["win"].rolling(window, min_periods=max(1, window//2)).mean()
-        return s
-
 def load_teams():
+    """(team_id, name, abbreviation) rows ordered by abbreviation; plain tuples, no DataFrame needed."""
     with get_conn() as con:
-        return pd.read_sql_query("SELECT team_id, name, abbreviation FROM teams ORDER BY abbreviation", con)
+        return con.execute("SELECT team_id, name, abbreviation FROM teams ORDER BY abbreviation").fetchall()
+
+# Upgrade an older DB (e.g. TEXT games.date) once at startup, on its own connection; get_conn never writes
+with closing(get_conn()) as con:
+    migrate(con)
 
 TEAMS = load_teams()
-TEAM_ID_BY_ABBR = dict(zip(TEAMS.abbreviation, TEAMS.team_id))
-ABBR_BY_ID = dict(zip(TEAMS.team_id, TEAMS.abbreviation))
+ABBR_BY_ID = {tid: abbr for tid, _, abbr in TEAMS}
+
+# team_id -> abbreviation as an array indexed by id, for vectorized lookups over whole columns.
+# The extra last slot stays None and absorbs ids beyond the known teams (see abbr_lookup).
+ABBR_LUT = np.empty(max(ABBR_BY_ID, default=0) + 2, dtype=object)
+ABBR_LUT[list(ABBR_BY_ID)] = list(ABBR_BY_ID.values())
+
+def abbr_lookup(team_ids) -> np.ndarray:
+    ids = np.asarray(team_ids)
+    return ABBR_LUT[np.minimum(ids, len(ABBR_LUT) - 1)]
 
 # Basic games frame
 # columns: date, game_id, home/away ids, scores
+# games.date is unix seconds; converted once, vectorized, with compact int dtypes for later joins
+
+GAME_DTYPES = {
+    "game_id": "int32",
+    "home_team_id": "int16",
+    "away_team_id": "int16",
+    "home_score": "int16",
+    "away_score": "int16",
+}
 
 def load_games():
+    """All completed games, ordered by date (read through idx_games_date)."""
     with get_conn() as con:
         df = pd.read_sql_query(
             """
             SELECT game_id, date, home_team_id, away_team_id, home_score, away_score
             FROM games
             WHERE home_score IS NOT NULL AND away_score IS NOT NULL
-            ORDER BY date
+            ORDER BY date, game_id
             """,
             con,
-            parse_dates=["date"],
         )
-    return df
-
-GAMES = load_games()
+    df["date"] = pd.to_datetime(df["date"], unit="s")
+    return df.astype(GAME_DTYPES)
 
 # ------------------------
 # Feature engineering for trends & simple model
 # ------------------------
 
+TEAM_GAME_DTYPES = {
+    "game_id": "int32",
+    "team_id": "int16",
+    "opp_id": "int16",
+    "runs_for": "int8",
+    "runs_against": "int8",
+    "is_home": "int8",
+    "win": "int8",
+}
+
 def team_game_view(games: pd.DataFrame) -> pd.DataFrame:
     """Flatten games to per-team rows with columns: date, team_id, opp_id, is_home, runs_for, runs_against, win."""
-    home = games[["game_id", "date", "home_team_id", "away_team_id", "home_score", "away_score"]].copy()
-    home.columns = ["game_id", "date", "team_id", "opp_id", "runs_for", "runs_against"]
-    home["is_home"] = 1
-    away = games[["game_id", "date", "away_team_id", "home_team_id", "away_score", "home_score"]].copy()
-    away.columns = ["game_id", "date", "team_id", "opp_id", "runs_for", "runs_against"]
-    away["is_home"] = 0
-    df = pd.concat([home, away], ignore_index=True)
-    df["win"] = (df["runs_for"] > df["runs_against"]).astype(int)
-    return df
+    # home rows then away rows, one np.concatenate per column and a single DataFrame allocation
+    # (no per-side .copy() + pd.concat); narrow ints (team ids < 32k, runs < 128) keep callback scans small
+    game_id = games["game_id"].to_numpy(dtype=TEAM_GAME_DTYPES["game_id"])
+    date = games["date"].to_numpy()
+    home_id = games["home_team_id"].to_numpy(dtype=TEAM_GAME_DTYPES["team_id"])
+    away_id = games["away_team_id"].to_numpy(dtype=TEAM_GAME_DTYPES["team_id"])
+    home_score = games["home_score"].to_numpy(dtype=TEAM_GAME_DTYPES["runs_for"])
+    away_score = games["away_score"].to_numpy(dtype=TEAM_GAME_DTYPES["runs_for"])
+
+    runs_for = np.concatenate([home_score, away_score])
+    runs_against = np.concatenate([away_score, home_score])
+    df = pd.DataFrame({
+        "game_id": np.concatenate([game_id, game_id]),
+        "date": np.concatenate([date, date]),
+        "team_id": np.concatenate([home_id, away_id]),
+        "opp_id": np.concatenate([away_id, home_id]),
+        "runs_for": runs_for,
+        "runs_against": runs_against,
+        "is_home": np.repeat(np.array([1, 0], dtype=TEAM_GAME_DTYPES["is_home"]), len(games)),
+        "win": np.greater(runs_for, runs_against).astype(TEAM_GAME_DTYPES["win"]),
+    })
+    # stable sort by date once, so every per-team subset below is already in date order
+    return df.sort_values("date", kind="stable", ignore_index=True)
 
-TEAM_GAMES = team_game_view(GAMES)
+# Per-team views built once per DB state, so callbacks index a dict instead of scanning TEAM_GAMES
 
-# Rolling win pct helper per team
+@lru_cache(maxsize=1)
+def by_team(key: str) -> dict:
+    team_games_df = load_frames(key)[0]
+    return {tid: g.reset_index(drop=True) for tid, g in team_games_df.groupby("team_id", sort=False)}
 
-def rolling_win_pct(df: pd.DataFrame, team_id: int, window: int = 10):
-    t = df[df.team_id == team_id].sort_values("date").copy()
-    t["rolling_win_pct"] = t.roll.winpct(window)
-    return t
+def team_games(team_id: int) -> pd.DataFrame:
+    """Date-ordered rows for one team (empty frame if the team has no games)."""
+    key = data_key()
+    return by_team(key).get(team_id, load_frames(key)[0].iloc[:0])
 
 # Simple model: predict home team win using last-10 win pct of home vs away and home advantage
 
-def build_home_win_dataset(games: pd.DataFrame) -> pd.DataFrame:
-    df = games.copy()
+def build_home_win_dataset(games: pd.DataFrame, team_games_df: pd.DataFrame) -> pd.DataFrame:
     # compute last-10 win pct per team over time
-    tg = TEAM_GAMES.sort_values(["team_id", "date"]).copy()
-    tg["r10"] = tg.groupby("team_id")["win"].transform(lambda s: s.rolling(10, min_periods=5).mean())
-    # merge r10 for home/away on that game_id/date
-    home = tg[tg.is_home == 1][["game_id", "team_id", "date", "r10"]]
-    away = tg[tg.is_home == 0][["game_id", "team_id", "date", "r10"]]
-    home.columns = ["game_id", "home_team_id", "date", "home_r10"]
-    away.columns = ["game_id", "away_team_id", "date", "away_r10"]
-    m = df.merge(home, on=["game_id", "date", "home_team_id"], how="left")
-    m = m.merge(away, on=["game_id", "date", "away_team_id"], how="left")
-    m["home_win"] = (m.home_score > m.away_score).astype(int)
+    # (single groupby.rolling stays in pandas' C kernel; team_games_df is already date-ordered within each team)
+    r10 = team_games_df.groupby("team_id", sort=False)["win"].rolling(10, min_periods=5).mean()
+    tg = team_games_df.assign(r10=r10.reset_index(level=0, drop=True).astype("float32"))
+    # merge r10 for home/away on that game_id
+    home = tg.loc[tg.is_home == 1, ["game_id", "r10"]].rename(columns={"r10": "home_r10"})
+    away = tg.loc[tg.is_home == 0, ["game_id", "r10"]].rename(columns={"r10": "away_r10"})
+    m = games.merge(home, on="game_id", how="left").merge(away, on="game_id", how="left")
+    m = m.dropna(subset=["home_r10", "away_r10"]).reset_index(drop=True)  # keep rows with some history
+    m["home_win"] = (m.home_score > m.away_score).astype("int64")
     # simple features
-    m["r10_diff"] = m["home_r10"].fillna(0.5) - m["away_r10"].fillna(0.5)
+    m["r10_diff"] = m["home_r10"] - m["away_r10"]
     m["is_home"] = 1  # target is always home team win
-    return m.dropna(subset=["home_r10", "away_r10"])  # keep rows with some history
+    return m
+
+# ------------------------
+# Lazy, disk-cached frames
+# ------------------------
+# TEAM_GAMES / HOME_DS are built on first use (not at import) and kept as parquet under CACHE_DIR,
+# keyed by the DB state, so restarts and extra workers just read them back.
+
+def data_key() -> str:
+    """Digest of the DB file (and its WAL) size + mtime; changes whenever a loader writes."""
+    h = hashlib.md5()
+    for path in (DB_PATH, DB_PATH.with_name(DB_PATH.name + "-wal")):
+        if path.exists() and path.stat().st_size:
+            st = path.stat()
+            h.update(f"{path.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()
+
+FRAMES_LOCK = threading.Lock()  # one build per process; other threads wait and then read the files
+
+def write_parquet(df: pd.DataFrame, path: Path):
+    """Write to a temp name and swap it in, so readers never see a half-written file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+    os.replace(tmp, path)
+
+@lru_cache(maxsize=1)
+def load_frames(key: str):
+    """(TEAM_GAMES, HOME_DS) for the DB state `key`."""
+    tg_path = CACHE_DIR / f"team_games_{key}.parquet"
+    ds_path = CACHE_DIR / f"home_ds_{key}.parquet"
+    with FRAMES_LOCK:
+        try:
+            return pd.read_parquet(tg_path, engine="pyarrow"), pd.read_parquet(ds_path, engine="pyarrow")
+        except FileNotFoundError:
+            pass  # not built yet for this DB state (or removed as stale by a newer build)
+
+        games = load_games()
+        team_games_df = team_game_view(games)
+        home_ds = build_home_win_dataset(games, team_games_df)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_parquet(team_games_df, tg_path)
+        write_parquet(home_ds, ds_path)
+        for stale in CACHE_DIR.glob("*.parquet"):
+            if stale not in (tg_path, ds_path):
+                stale.unlink(missing_ok=True)  # another process may have removed it already
+        return team_games_df, home_ds
+
+# Fit on the games in [start, end] of the DB state `key`; None if the range has too few games to train on.
+
+def fit_model(key: str, start: pd.Timestamp, end: pd.Timestamp):
+    home_ds = load_frames(key)[1]
+    ds = home_ds[(home_ds.date >= start) & (home_ds.date <= end)].dropna(subset=["r10_diff"]).copy()
+    if len(ds) < 50:
+        return None
+
+    X = ds[["r10_diff", "is_home"]].values
+    y = ds["home_win"].values
+
+    # Train/score split by time: first 80% as train, last 20% as test
+    split_idx = int(len(ds) * 0.8)
+    X_train, X_test = X[:split_idx], X[split_idx:]
+    y_train, y_test = y[:split_idx], y[split_idx:]
+
+    # Logistic model trained by SGD; a fresh, seeded estimator per fit so a range always gives the same coefficients
+    model = SGDClassifier(loss="log_loss", alpha=1e-4, max_iter=20, tol=None, random_state=0)
+    model.fit(X_train, y_train)
+    proba = model.predict_proba(X_test)[:,1]
+    auc = roc_auc_score(y_test, proba)
 
-HOME_DS = build_home_win_dataset(GAMES)
+    # Test games with predicted prob and actual result
+    test_view = ds.iloc[split_idx:].copy()
+    test_view = test_view.assign(pred_home_win=proba)
+    test_view = test_view[["date", "home_team_id", "away_team_id", "home_score", "away_score", "home_win", "home_r10", "away_r10", "pred_home_win"]]
+    test_view["home"] = abbr_lookup(test_view["home_team_id"].to_numpy())
+    test_view["away"] = abbr_lookup(test_view["away_team_id"].to_numpy())
+    return model, auc, test_view
 
 # ------------------------
 # Dash app
 # ------------------------
 
-app = Dash(__name__)
+# Model fits run in a background process per call; outputs are cached on disk per inputs + DB state.
+background_callback_manager = DiskcacheManager(
+    diskcache.Cache(str(CACHE_DIR / "dash")),
+    cache_by=[data_key],
+    expire=3600,
+)
+
+# tab bodies are created by render_tab, so their callbacks reference ids not in the initial layout
+app = Dash(__name__, suppress_callback_exceptions=True, background_callback_manager=background_callback_manager)
 app.title = "MLB Trends & Model"
 
-team_options = [
-    {"label": f"{abbr}", "value": tid} for abbr, tid in TEAM_ID_BY_ABBR.items()
-]
-team_options_sorted = sorted(team_options, key=lambda x: x["label"]) 
+team_options_sorted = [{"label": abbr, "value": tid} for tid, _, abbr in TEAMS]  # already ORDER BY abbreviation
 
-app.layout = html.Div([
-    html.H1("MLB Trends & Predictive Model"),
+def serve_layout():
+    # called per page load, so the game frames are only built once someone opens the app
+    team_games_df = load_frames(data_key())[0]
+    return html.Div([
+        html.H1("MLB Trends & Predictive Model"),
 
-    html.Div([
-        html.Div([
-            html.Label("Team"),
-            dcc.Dropdown(options=team_options_sorted, value=team_options_sorted[0]["value"], id="team-select"),
-        ], style={"width": "32%", "display": "inline-block", "verticalAlign": "top"}),
         html.Div([
-            html.Label("Rolling Window (games)"),
-            dcc.Slider(min=5, max=30, step=1, value=10, id="win-window",
-                       marks={5:"5",10:"10",20:"20",30:"30"}),
-        ], style={"width": "32%", "display": "inline-block", "padding": "0 20px"}),
-        html.Div([
-            html.Label("Date Range"),
-            dcc.DatePickerRange(
-                id="date-range",
-                min_date_allowed=TEAM_GAMES.date.min(),
-                max_date_allowed=TEAM_GAMES.date.max(),
-                start_date=(TEAM_GAMES.date.max() - pd.Timedelta(days=60)).date(),
-                end_date=TEAM_GAMES.date.max().date(),
-            ),
-        ], style={"width": "32%", "display": "inline-block"}),
-    ], style={"marginBottom": 20}),
-
-    dcc.Tabs(id="tabs", value="tab-trend", children=[
-        dcc.Tab(label="Team Trend (Rolling Win %)", value="tab-trend"),
-        dcc.Tab(label="Runs For/Against", value="tab-runs"),
-        dcc.Tab(label="Win Model (Home)", value="tab-model"),
-    ]),
-
-    html.Div(id="tab-content"),
-])
+            html.Div([
+                html.Label("Team"),
+                dcc.Dropdown(options=team_options_sorted, value=team_options_sorted[0]["value"], id="team-select"),
+            ], style={"width": "32%", "display": "inline-block", "verticalAlign": "top"}),
+            html.Div([
+                html.Label("Rolling Window (games)"),
+                dcc.Slider(min=5, max=30, step=1, value=10, id="win-window",
+                           marks={5:"5",10:"10",20:"20",30:"30"}),
+            ], style={"width": "32%", "display": "inline-block", "padding": "0 20px"}),
+            html.Div([
+                html.Label("Date Range"),
+                dcc.DatePickerRange(
+                    id="date-range",
+                    min_date_allowed=team_games_df.date.min(),
+                    max_date_allowed=team_games_df.date.max(),
+                    start_date=(team_games_df.date.max() - pd.Timedelta(days=60)).date(),
+                    end_date=team_games_df.date.max().date(),
+                ),
+            ], style={"width": "32%", "display": "inline-block"}),
+        ], style={"marginBottom": 20}),
+
+        dcc.Tabs(id="tabs", value="tab-trend", children=[
+            dcc.Tab(label="Team Trend (Rolling Win %)", value="tab-trend"),
+            dcc.Tab(label="Runs For/Against", value="tab-runs"),
+            dcc.Tab(label="Win Model (Home)", value="tab-model"),
+        ]),
+
+        html.Div(id="tab-content"),
+
+        # per-team arrays for the clientside trend/runs filters (src/assets/filters.js)
+        dcc.Store(id="team-data"),
+    ])
+
+app.layout = serve_layout
 
 # -------- Callbacks ---------
 
+@app.callback(
+    Output("team-data", "data"),
+    Input("team-select", "value"),
+)
+def load_team_data(team_id):
+    t = team_games(team_id)
+    return {
+        "abbr": ABBR_BY_ID.get(team_id, str(team_id)),
+        "date": t["date"].dt.strftime("%Y-%m-%d").tolist(),
+        "win": t["win"].tolist(),
+        "runs_for": t["runs_for"].tolist(),
+        "runs_against": t["runs_against"].tolist(),
+    }
+
 @app.callback(
     Output("tab-content", "children"),
     Input("tabs", "value"),
-    Input("team-select", "value"),
+)
+def render_tab(tab):
+    # trend/runs figures are filled in the browser from team-data; only the model needs the server
+    if tab == "tab-trend":
+        return html.Div([dcc.Graph(id="trend-graph"), html.Div(id="trend-count")])
+    if tab == "tab-runs":
+        return html.Div([dcc.Graph(id="runs-graph"), html.Div(id="runs-count")])
+    return html.Div([html.Div(id="model-status"), html.Div(id="model-content")])
+
+app.clientside_callback(
+    ClientsideFunction(namespace="filters", function_name="trend"),
+    Output("trend-graph", "figure"),
+    Output("trend-count", "children"),
+    Input("date-range", "start_date"),
+    Input("date-range", "end_date"),
     Input("win-window", "value"),
+    Input("team-data", "data"),
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="filters", function_name="runs"),
+    Output("runs-graph", "figure"),
+    Output("runs-count", "children"),
     Input("date-range", "start_date"),
     Input("date-range", "end_date"),
+    Input("team-data", "data"),
 )
-def render_tab(tab, team_id, window, start_date, end_date):
+
+@app.callback(
+    Output("model-content", "children"),
+    Input("date-range", "start_date"),
+    Input("date-range", "end_date"),
+    background=True,
+    running=[(Output("model-status", "children"), "Fitting model…", "")],
+)
+def render_model(start_date, end_date):
     start = pd.to_datetime(start_date)
     end = pd.to_datetime(end_date)
 
-    if tab == "tab-trend":
-        df = rolling_win_pct(TEAM_GAMES, team_id, window)
-        df = df[(df.date >= start) & (df.date <= end)]
-        abbr = ABBR_BY_ID.get(team_id, str(team_id))
-        fig = px.line(df, x="date", y="rolling_win_pct", title=f"{abbr} Rolling Win% (last {window})")
-        fig.update_yaxes(range=[0,1])
-        return html.Div([
-            dcc.Graph(figure=fig),
-            html.Div(f"Games shown: {len(df)}")
-        ])
-
-    if tab == "tab-runs":
-        df = TEAM_GAMES[TEAM_GAMES.team_id == team_id].copy()
-        df = df[(df.date >= start) & (df.date <= end)]
-        df["run_diff"] = df["runs_for"] - df["runs_against"]
-        fig = px.bar(df, x="date", y="run_diff", title="Run Differential by Game")
-        return html.Div([
-            dcc.Graph(figure=fig),
-            html.Div(f"Games shown: {len(df)}")
-        ])
-
     # Model tab
-    ds = HOME_DS[(HOME_DS.date >= start) & (HOME_DS.date <= end)].dropna(subset=["r10_diff"]).copy()
-    if len(ds) < 50:
+    fitted = fit_model(data_key(), start, end)
+    if fitted is None:
         return html.Div("Not enough historical games in selected range for training. Expand the date range.")
+    model, auc, test_view = fitted
 
-    X = ds[["r10_diff", "is_home"]].values
-    y = ds["home_win"].values
-
-    # Train/score split by time: first 80% as train, last 20% as test
-    split_idx = int(len(ds) * 0.8)
-    X_train, X_test = X[:split_idx], X[split_idx:]
-    y_train, y_test = y[:split_idx], y[split_idx:]
-
-    model = LogisticRegression(max_iter=1000)
-    model.fit(X_train, y_train)
-    proba = model.predict_proba(X_test)[:,1]
-    auc = roc_auc_score(y_test, proba)
-
-    coef = pd.DataFrame({
-        "feature": ["r10_diff", "is_home"],
-        "coef": model.coef_[0]
-    })
-
-    fig_coef = px.bar(coef, x="feature", y="coef", title=f"Model Coefficients (AUC={auc:.3f})")
+    # figures built straight from arrays with graph_objects (no plotly.express long-form frames)
+    fig_coef = go.Figure(
+        go.Bar(x=["r10_diff", "is_home"], y=model.coef_[0]),
+        layout=dict(title=f"Model Coefficients (AUC={auc:.3f})", xaxis=dict(title="feature"), yaxis=dict(title="coef")),
+    )
 
     # Show last N test games with predicted prob and actual result
-    test_view = ds.iloc[split_idx:].copy()
-    test_view = test_view.assign(pred_home_win=proba)
-    test_view = test_view[["date", "home_team_id", "away_team_id", "home_score", "away_score", "home_win", "home_r10", "away_r10", "pred_home_win"]]
-    test_view["home"] = test_view["home_team_id"].map(ABBR_BY_ID)
-    test_view["away"] = test_view["away_team_id"].map(ABBR_BY_ID)
-
     tbl = test_view.tail(20)
+    hover_cols = ["home", "away", "home_r10", "away_r10", "home_win", "home_score", "away_score"]
+    fmt = {"home_r10": ":.3f", "away_r10": ":.3f"}  # float32 columns, trim the repr noise
+    hover = "<br>".join(f"{c}=%{{customdata[{i}]{fmt.get(c, '')}}}" for i, c in enumerate(hover_cols))
+    fig_pred = go.Figure(
+        go.Scattergl(
+            x=tbl["date"].to_numpy(),
+            y=tbl["pred_home_win"].to_numpy(),
+            mode="markers",
+            customdata=tbl[hover_cols].to_numpy(),
+            hovertemplate=f"date=%{{x}}<br>pred_home_win=%{{y}}<br>{hover}<extra></extra>",
+        ),
+        layout=dict(
+            title="Predicted Home Win Prob (last 20 test games)",
+            xaxis=dict(title="date"),
+            yaxis=dict(title="pred_home_win", range=[0, 1]),
+        ),
+    )
 
     return html.Div([
         dcc.Graph(figure=fig_coef),
@@ -238,7 +390,7 @@ Columns:
 - **pred_home_win**: model's probability that the home team wins
 - **home_win**: 1 if home team actually won
 """),
-        dcc.Graph(figure=px.scatter(tbl, x="date", y="pred_home_win", hover_data=["home","away","home_r10","away_r10","home_win","home_score","away_score"], title="Predicted Home Win Prob (last 20 test games)").update_yaxes(range=[0,1])),
+        dcc.Graph(figure=fig_pred),
     ])
 
 
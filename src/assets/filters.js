@@ -0,0 +1,68 @@
+// src/assets/filters.js
+// Clientside callbacks for the trend/runs tabs: filter the per-team arrays held in
+// dcc.Store("team-data") by date range (and rolling window) in the browser, no server round-trip.
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    filters: {
+        // Rolling win% over the team's full history (min_periods = max(1, window/2)),
+        // then sliced to [start, end] so early games in the range still see prior games.
+        trend: function (startDate, endDate, size, data) {
+            if (!data) {
+                return [window.dash_clientside.no_update, ""];
+            }
+            const minPeriods = Math.max(1, Math.floor(size / 2));
+            const start = (startDate || "").slice(0, 10);
+            const end = (endDate || "9999-12-31").slice(0, 10);
+            const x = [];
+            const y = [];
+            let sum = 0;
+            for (let i = 0; i < data.date.length; i++) {
+                sum += data.win[i];
+                if (i >= size) {
+                    sum -= data.win[i - size];
+                }
+                const count = Math.min(i + 1, size);
+                const d = data.date[i];
+                if (d >= start && d <= end) {
+                    x.push(d);
+                    y.push(count >= minPeriods ? sum / count : null);
+                }
+            }
+            const fig = {
+                data: [{type: "scattergl", mode: "lines", x: x, y: y, name: "rolling_win_pct"}],
+                layout: {
+                    title: {text: data.abbr + " Rolling Win% (last " + size + ")"},
+                    xaxis: {title: {text: "date"}},
+                    yaxis: {title: {text: "rolling_win_pct"}, range: [0, 1]},
+                },
+            };
+            return [fig, "Games shown: " + x.length];
+        },
+
+        runs: function (startDate, endDate, data) {
+            if (!data) {
+                return [window.dash_clientside.no_update, ""];
+            }
+            const start = (startDate || "").slice(0, 10);
+            const end = (endDate || "9999-12-31").slice(0, 10);
+            const x = [];
+            const y = [];
+            for (let i = 0; i < data.date.length; i++) {
+                const d = data.date[i];
+                if (d >= start && d <= end) {
+                    x.push(d);
+                    y.push(data.runs_for[i] - data.runs_against[i]);
+                }
+            }
+            const fig = {
+                data: [{type: "bar", x: x, y: y, name: "run_diff"}],
+                layout: {
+                    title: {text: "Run Differential by Game"},
+                    xaxis: {title: {text: "date"}},
+                    yaxis: {title: {text: "run_diff"}},
+                },
+            };
+            return [fig, "Games shown: " + x.length];
+        },
+    },
+});
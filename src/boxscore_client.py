@@ -0,0 +1,57 @@
+# src/boxscore_client.py
+# Shared box-score fetching for the batting/pitching loaders:
+# pooled requests.Session + thread pool, paced by one rate limiter across workers.
+import time
+import threading
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+BOX_URL = "https://statsapi.mlb.com/api/v1/game/{gamePk}/boxscore"
+MAX_WORKERS = 8
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`."""
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def fetch_boxscores(game_ids, sleep_secs: float = 0.12, timeout: int = 15, max_workers: int = MAX_WORKERS):
+    """
+    Fetch box scores concurrently and yield (game_id, box, error) in game_ids order.
+    `sleep_secs` is the average spacing between API calls across all workers (0 disables pacing).
+    On failure `box` is None and `error` holds the exception, so the caller can log and skip.
+    """
+    bucket = TokenBucket(1.0 / sleep_secs) if sleep_secs > 0 else None
+
+    def fetch(gid):
+        if bucket:
+            bucket.acquire()
+        try:
+            r = SESSION.get(BOX_URL.format(gamePk=gid), timeout=timeout)
+            r.raise_for_status()
+            return gid, orjson.loads(r.content), None  # faster than r.json() on large nested payloads
+        except Exception as e:
+            return gid, None, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(fetch, game_ids)
@@ -0,0 +1,33 @@
+# src/db.py
+# Shared SQLite connection for the loaders and the dashboard.
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path('data/mlb_stats.db')
+SCHEMA_VERSION = 2
+# 1: games.date stored as unix seconds instead of TEXT 'YYYY-MM-DD'
+# 2: idx_games_date, so the box-score loaders' date-range reads don't scan games
+
+def migrate(conn):
+    """Bring a database created by an older schema up to SCHEMA_VERSION (no-op once stamped)."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+    has_games = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games'").fetchone()
+    if has_games and version < 1:
+        conn.execute("""
+            UPDATE games SET date = CAST(strftime('%s', date) AS INTEGER)
+            WHERE typeof(date) = 'text' AND date != ''
+        """)
+    if has_games and version < 2:
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_games_date ON games(date)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+def get_conn():
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    migrate(conn)
+    return conn
@@ -1,7 +1,7 @@
-import sqlite3
+from db import get_conn
 
 def initialize_database():
-    conn = sqlite3.connect('data/mlb_stats.db')  # This will create the DB file if it doesn't exist
+    conn = get_conn()  # This will create the DB file if it doesn't exist (and stamp the schema version)
     with open('data/schema.sql', 'r') as f:
         conn.executescript(f.read())
     conn.commit()
@@ -3,7 +3,6 @@ import argparse
 import os
 import sqlite3
 from datetime import datetime
-from pathlib import Path
 
 # Import your existing loaders
 import load_teams
@@ -11,12 +10,11 @@ import load_players
 import load_games
 import load_player_game_stats
 import load_pitcher_game_stats
-
-DB_PATH = "data/mlb_stats.db"
+from db import DB_PATH
 
 def ensure_db_exists():
     """Create DB from schema if it doesn't exist yet."""
-    if not Path(DB_PATH).exists():
+    if not DB_PATH.exists():
         print("ℹ️ Database not found. Initializing schema...")
         from init_db import initialize_database
         initialize_database()
@@ -40,13 +38,14 @@ def main():
     parser.add_argument("--skip-games", action="store_true", help="Skip loading games")
     parser.add_argument("--skip-batting", action="store_true", help="Skip loading player batting box scores")
     parser.add_argument("--skip-pitching", action="store_true", help="Skip loading pitcher box scores")
-    parser.add_argument("--sleep", type=float, default=0.12, help="Sleep seconds between API calls (default 0.12)")
+    parser.add_argument("--sleep", type=float, default=0.12, help="Average seconds between box-score API calls across workers (default 0.12)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent box-score fetches (default 8)")
     args = parser.parse_args()
 
     ensure_db_exists()
 
     # sanity check DB path exists
-    if not Path(DB_PATH).exists():
+    if not DB_PATH.exists():
         raise SystemExit(f"Database not found at {DB_PATH}")
 
     # 1) Teams
@@ -67,12 +66,12 @@ def main():
     # 4) Batting box scores
     if not args.skip_batting:
         print(f"➡️  Loading batting lines from {args.start} to {args.end} ...")
-        load_player_game_stats.load_player_game_stats(args.start, args.end, sleep_secs=args.sleep)
+        load_player_game_stats.load_player_game_stats(args.start, args.end, sleep_secs=args.sleep, max_workers=args.workers)
 
     # 5) Pitching box scores
     if not args.skip_pitching:
         print(f"➡️  Loading pitching lines from {args.start} to {args.end} ...")
-        load_pitcher_game_stats.load_pitcher_game_stats(args.start, args.end, sleep_secs=args.sleep)
+        load_pitcher_game_stats.load_pitcher_game_stats(args.start, args.end, sleep_secs=args.sleep, max_workers=args.workers)
 
     print("✅ All requested loaders finished.")
 
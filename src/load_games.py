@@ -1,12 +1,18 @@
 # src/load_games.py
-import sqlite3
 import statsapi
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 
-DB_PATH = 'data/mlb_stats.db'
+from db import get_conn
 
-def upsert_game(cur, pk, gdate, home_id, away_id, home_score, away_score, venue):
-    cur.execute("""
+def ymd_to_epoch(ymd: str):
+    """'YYYY-MM-DD' -> unix seconds at UTC midnight (games.date is stored as INTEGER)."""
+    if not ymd:
+        return None
+    return int(datetime.fromisoformat(ymd).replace(tzinfo=timezone.utc).timestamp())
+
+def upsert_games(cur, rows):
+    """rows: (game_id, date, home_id, away_id, home_score, away_score, venue) tuples."""
+    cur.executemany("""
         INSERT INTO games (game_id, date, home_team_id, away_team_id, home_score, away_score, venue)
         VALUES (?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(game_id) DO UPDATE SET
@@ -16,14 +22,14 @@ def upsert_game(cur, pk, gdate, home_id, away_id, home_score, away_score, venue)
             home_score=COALESCE(excluded.home_score, games.home_score),
             away_score=COALESCE(excluded.away_score, games.away_score),
             venue=excluded.venue
-    """, (pk, gdate, home_id, away_id, home_score, away_score, venue))
+    """, rows)
 
 def load_games_by_range(start_ymd: str, end_ymd: str):
     """
     Pull MLB schedule from the raw endpoint (has gamePk) and upsert into games table.
     Dates must be YYYY-MM-DD.
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     # ✅ Add sportId=1 (MLB)
@@ -33,7 +39,7 @@ def load_games_by_range(start_ymd: str, end_ymd: str):
         'sportId': 1
     })
     dates = sched.get('dates', [])
-    n = 0
+    rows = []
 
     for d in dates:
         for g in d.get('games', []):
@@ -53,12 +59,12 @@ def load_games_by_range(start_ymd: str, end_ymd: str):
             venue = (g.get('venue') or {}).get('name', '')
 
             if home_id and away_id:
-                upsert_game(cur, pk, gdate_iso, home_id, away_id, home_score, away_score, venue)
-                n += 1
+                rows.append((pk, ymd_to_epoch(gdate_iso), home_id, away_id, home_score, away_score, venue))
 
+    upsert_games(cur, rows)
     conn.commit()
     conn.close()
-    print(f"✅ Upserted {n} games from {start_ymd} to {end_ymd}")
+    print(f"✅ Upserted {len(rows)} games from {start_ymd} to {end_ymd}")
 
 if __name__ == "__main__":
     end = date.today()
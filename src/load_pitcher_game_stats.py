@@ -1,11 +1,12 @@
 # src/load_pitcher_game_stats.py
-import time
-import sqlite3
-import requests
+import numpy as np
+from itertools import repeat
 from datetime import date, timedelta
 
-DB_PATH = 'data/mlb_stats.db'
-BOX_URL = "https://statsapi.mlb.com/api/v1/game/{gamePk}/boxscore"
+from boxscore_client import MAX_WORKERS, fetch_boxscores
+from db import get_conn
+
+FLUSH_EVERY = 25  # games buffered per executemany/commit
 
 # ---------- schema ----------
 def ensure_schema(conn):
@@ -38,36 +39,32 @@ def ensure_schema(conn):
     conn.commit()
 
 # ---------- helpers ----------
-def upsert_min_player(cur, person, team_id=None):
-    pid = person.get('id')
-    if not pid:
-        return
-    name = person.get('fullName', '')
-    cur.execute("""
+def upsert_min_players(cur, rows):
+    """rows: (player_id, name, team_id) tuples."""
+    cur.executemany("""
         INSERT INTO players (player_id, name, team_id, position, birthdate)
         VALUES (?, ?, ?, NULL, NULL)
         ON CONFLICT(player_id) DO UPDATE SET
             name=COALESCE(excluded.name, players.name),
             team_id=COALESCE(excluded.team_id, players.team_id)
-    """, (pid, name, team_id))
+    """, rows)
+
+# API keys for the integer pitching columns, in insert order after outs_pitched
+PITCH_KEYS = ("hits", "runs", "earnedRuns", "homeRuns", "baseOnBalls",
+              "strikeOuts", "battersFaced", "pitchesThrown", "strikes")
 
-def ip_str_to_outs(ip_str):
+def split_ip(ip_str):
     """
-    Convert MLB 'inningsPitched' strings to outs.
-    Examples: '5.0' -> 15 outs; '5.1' -> 16 outs; '5.2' -> 17 outs.
+    Split MLB 'inningsPitched' strings into (whole innings, extra outs).
+    Examples: '5.0' -> (5, 0); '5.1' -> (5, 1); '5.2' -> (5, 2).
     """
     if not ip_str:
-        return 0
+        return 0, 0
     try:
         whole, dot, frac = ip_str.partition('.')
-        outs = int(whole) * 3
-        if frac == '1':
-            outs += 1
-        elif frac == '2':
-            outs += 2
-        return outs
+        return int(whole), (int(frac) if frac in ('1', '2') else 0)
     except Exception:
-        return 0
+        return 0, 0
 
 def to_int(x):
     try:
@@ -75,32 +72,32 @@ def to_int(x):
     except Exception:
         return 0
 
-def extract_pitching(node):
-    pitch = (node.get('stats') or {}).get('pitching') or {}
-    ip = pitch.get('inningsPitched')  # string like '5.2'
-    return {
-        "outs_pitched":       ip_str_to_outs(ip),
-        "hits_allowed":       to_int(pitch.get("hits")),
-        "runs_allowed":       to_int(pitch.get("runs")),
-        "earned_runs":        to_int(pitch.get("earnedRuns")),
-        "home_runs_allowed":  to_int(pitch.get("homeRuns")),
-        "walks":              to_int(pitch.get("baseOnBalls")),
-        "strikeouts":         to_int(pitch.get("strikeOuts")),
-        "batters_faced":      to_int(pitch.get("battersFaced")),
-        "pitches":            to_int(pitch.get("pitchesThrown")),
-        "strikes":            to_int(pitch.get("strikes")),
-        "decision":           (node.get("note") or pitch.get("note") or None),
-    }
-
-def any_stats(line):
-    return any([
-        line["outs_pitched"], line["hits_allowed"], line["runs_allowed"], line["earned_runs"],
-        line["home_runs_allowed"], line["walks"], line["strikeouts"], line["batters_faced"],
-        line["pitches"], line["strikes"]
-    ])
-
-def insert_row(cur, game_id, player_id, line):
-    cur.execute("""
+def extract_pitching(nodes):
+    """
+    Column-wise pitching lines for a list of box-score player nodes.
+    Returns (stats, decisions): stats is an int32 array [N, 10] with outs_pitched first,
+    then PITCH_KEYS; decisions is a list of N notes ('W','L','S') or None.
+    """
+    pitches = [(node.get('stats') or {}).get('pitching') or {} for node in nodes]
+    n = len(pitches)
+    ip = [split_ip(p.get('inningsPitched')) for p in pitches]  # strings like '5.2'
+    whole = np.fromiter((w for w, _ in ip), dtype=np.int32, count=n)
+    frac = np.fromiter((f for _, f in ip), dtype=np.int32, count=n)
+
+    stats = np.empty((n, 1 + len(PITCH_KEYS)), dtype=np.int32)
+    stats[:, 0] = whole * 3 + frac  # outs pitched
+    for j, key in enumerate(PITCH_KEYS, 1):
+        stats[:, j] = np.fromiter((to_int(p.get(key)) for p in pitches), dtype=np.int32, count=n)
+
+    decisions = [(node.get("note") or p.get("note") or None) for node, p in zip(nodes, pitches)]
+    return stats, decisions
+
+def any_stats(stats):
+    """Row mask of pitching lines with at least one non-zero stat."""
+    return np.any(stats != 0, axis=1)
+
+def insert_rows(cur, rows):
+    cur.executemany("""
         INSERT INTO pitcher_game_stats
             (game_id, player_id, outs_pitched, hits_allowed, runs_allowed, earned_runs,
              home_runs_allowed, walks, strikeouts, batters_faced, pitches, strikes, decision)
@@ -117,25 +114,30 @@ def insert_row(cur, game_id, player_id, line):
             pitches=excluded.pitches,
             strikes=excluded.strikes,
             decision=COALESCE(excluded.decision, pitcher_game_stats.decision)
-    """, (
-        game_id, player_id,
-        line["outs_pitched"], line["hits_allowed"], line["runs_allowed"], line["earned_runs"],
-        line["home_runs_allowed"], line["walks"], line["strikeouts"], line["batters_faced"],
-        line["pitches"], line["strikes"], line["decision"]
-    ))
+    """, rows)
+
+def flush(conn, player_rows, stat_rows):
+    """Write buffered player and stat rows in one transaction, then clear the buffers."""
+    cur = conn.cursor()
+    upsert_min_players(cur, player_rows)
+    insert_rows(cur, stat_rows)
+    conn.commit()
+    player_rows.clear()
+    stat_rows.clear()
 
 # ---------- main ----------
-def load_pitcher_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.12, timeout: int = 15):
+def load_pitcher_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.12, timeout: int = 15,
+                            max_workers: int = MAX_WORKERS):
     """
     Pull box scores from MLB API and store pitching lines for completed games in [start, end].
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     ensure_schema(conn)
     cur = conn.cursor()
 
     cur.execute("""
         SELECT game_id FROM games
-        WHERE date BETWEEN ? AND ?
+        WHERE date BETWEEN CAST(strftime('%s', ?) AS INTEGER) AND CAST(strftime('%s', ?) AS INTEGER)
           AND home_score IS NOT NULL
           AND away_score IS NOT NULL
         ORDER BY date
@@ -143,14 +145,12 @@ def load_pitcher_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.
     game_ids = [r[0] for r in cur.fetchall()]
 
     total = 0
-    for idx, gid in enumerate(game_ids, 1):
-        url = BOX_URL.format(gamePk=gid)
-        try:
-            r = requests.get(url, timeout=timeout)
-            r.raise_for_status()
-            box = r.json()
-        except Exception as e:
-            print(f"⚠️  Skipping game {gid}: {e}")
+    player_rows, stat_rows = [], []
+    # fetches run in worker threads; rows are written here (sqlite is single-writer)
+    boxes = fetch_boxscores(game_ids, sleep_secs=sleep_secs, timeout=timeout, max_workers=max_workers)
+    for idx, (gid, box, err) in enumerate(boxes, 1):
+        if err is not None:
+            print(f"⚠️  Skipping game {gid}: {err}")
             continue
 
         for side in ("home", "away"):
@@ -158,25 +158,25 @@ def load_pitcher_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.
             team_info = team_node.get("team") or {}
             team_id = team_info.get("id")
             players = (team_node.get("players") or {})
+            nodes = [node for node in players.values() if (node.get("person") or {}).get("id")]
 
-            for _, node in players.items():
-                person = node.get("person") or {}
-                pid = person.get("id")
-                if not pid:
-                    continue
-                if team_id:
-                    upsert_min_player(cur, person, team_id)
+            if team_id:
+                player_rows.extend(
+                    (node["person"]["id"], node["person"].get("fullName", ""), team_id) for node in nodes
+                )
 
-                line = extract_pitching(node)
-                if any_stats(line):
-                    insert_row(cur, gid, pid, line)
-                    total += 1
+            stats, decisions = extract_pitching(nodes)
+            keep = any_stats(stats)
+            pids = np.fromiter((node["person"]["id"] for node in nodes), dtype=np.int64, count=len(nodes))[keep]
+            stats = stats[keep]
+            decisions = [d for d, k in zip(decisions, keep.tolist()) if k]
+            stat_rows.extend(zip(repeat(gid), pids.tolist(), *stats.T.tolist(), decisions))
+            total += len(pids)
 
-        if idx % 25 == 0:
-            conn.commit()
-        time.sleep(sleep_secs)
+        if idx % FLUSH_EVERY == 0:
+            flush(conn, player_rows, stat_rows)
 
-    conn.commit()
+    flush(conn, player_rows, stat_rows)
     conn.close()
     print(f"✅ Upserted {total} pitcher-game rows across {len(game_ids)} games")
 
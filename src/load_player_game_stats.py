@@ -1,10 +1,11 @@
-import time
-import sqlite3
-import requests
+import numpy as np
+from itertools import repeat
 from datetime import date, timedelta
 
-DB_PATH = 'data/mlb_stats.db'
-BOX_URL = "https://statsapi.mlb.com/api/v1/game/{gamePk}/boxscore"
+from boxscore_client import MAX_WORKERS, fetch_boxscores
+from db import get_conn
+
+FLUSH_EVERY = 25  # games buffered per executemany/commit
 
 def ensure_schema(conn):
     cur = conn.cursor()
@@ -29,18 +30,15 @@ def ensure_schema(conn):
     cur.execute("CREATE INDEX IF NOT EXISTS idx_pgs_game ON player_game_stats(game_id)")
     conn.commit()
 
-def upsert_min_player(cur, person, team_id=None):
-    pid = person.get('id')
-    if not pid:
-        return
-    name = person.get('fullName', '')
-    cur.execute("""
+def upsert_min_players(cur, rows):
+    """rows: (player_id, name, team_id) tuples."""
+    cur.executemany("""
         INSERT INTO players (player_id, name, team_id, position, birthdate)
         VALUES (?, ?, ?, NULL, NULL)
         ON CONFLICT(player_id) DO UPDATE SET
             name=COALESCE(excluded.name, players.name),
             team_id=COALESCE(excluded.team_id, players.team_id)
-    """, (pid, name, team_id))
+    """, rows)
 
 def to_int(x):
     try:
@@ -48,23 +46,23 @@ def to_int(x):
     except Exception:
         return 0
 
-def extract_batting(node):
-    bat = (node.get('stats') or {}).get('batting') or {}
-    return {
-        "at_bats":    to_int(bat.get("atBats")),
-        "hits":       to_int(bat.get("hits")),
-        "runs":       to_int(bat.get("runs")),
-        "home_runs":  to_int(bat.get("homeRuns")),
-        "rbi":        to_int(bat.get("rbi")),
-        "walks":      to_int(bat.get("baseOnBalls")),
-        "strikeouts": to_int(bat.get("strikeOuts")),
-    }
-
-def any_batting(line):
-    return any(line.values())
-
-def insert_row(cur, game_id, player_id, line):
-    cur.execute("""
+# API keys for the batting columns, in insert order
+BAT_KEYS = ("atBats", "hits", "runs", "homeRuns", "rbi", "baseOnBalls", "strikeOuts")
+
+def extract_batting(nodes):
+    """Column-wise batting lines for a list of box-score player nodes, as an int32 array [N, 7] in BAT_KEYS order."""
+    bats = [(node.get('stats') or {}).get('batting') or {} for node in nodes]
+    stats = np.empty((len(bats), len(BAT_KEYS)), dtype=np.int32)
+    for j, key in enumerate(BAT_KEYS):
+        stats[:, j] = np.fromiter((to_int(b.get(key)) for b in bats), dtype=np.int32, count=len(bats))
+    return stats
+
+def any_batting(stats):
+    """Row mask of batting lines with at least one non-zero stat."""
+    return np.any(stats != 0, axis=1)
+
+def insert_rows(cur, rows):
+    cur.executemany("""
         INSERT INTO player_game_stats
             (game_id, player_id, at_bats, hits, runs, home_runs, rbi, walks, strikeouts)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -76,18 +74,27 @@ def insert_row(cur, game_id, player_id, line):
             rbi=excluded.rbi,
             walks=excluded.walks,
             strikeouts=excluded.strikeouts
-    """, (game_id, player_id, line["at_bats"], line["hits"], line["runs"],
-          line["home_runs"], line["rbi"], line["walks"], line["strikeouts"]))
+    """, rows)
 
-def load_player_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.12, timeout: int = 15):
-    conn = sqlite3.connect(DB_PATH)
+def flush(conn, player_rows, stat_rows):
+    """Write buffered player and stat rows in one transaction, then clear the buffers."""
+    cur = conn.cursor()
+    upsert_min_players(cur, player_rows)
+    insert_rows(cur, stat_rows)
+    conn.commit()
+    player_rows.clear()
+    stat_rows.clear()
+
+def load_player_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.12, timeout: int = 15,
+                           max_workers: int = MAX_WORKERS):
+    conn = get_conn()
     ensure_schema(conn)
     cur = conn.cursor()
 
     # Only completed games (scores present)
     cur.execute("""
         SELECT game_id FROM games
-        WHERE date BETWEEN ? AND ?
+        WHERE date BETWEEN CAST(strftime('%s', ?) AS INTEGER) AND CAST(strftime('%s', ?) AS INTEGER)
           AND home_score IS NOT NULL
           AND away_score IS NOT NULL
         ORDER BY date
@@ -95,14 +102,12 @@ def load_player_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.1
     game_ids = [r[0] for r in cur.fetchall()]
 
     total = 0
-    for idx, gid in enumerate(game_ids, 1):
-        url = BOX_URL.format(gamePk=gid)
-        try:
-            r = requests.get(url, timeout=timeout)
-            r.raise_for_status()
-            box = r.json()
-        except Exception as e:
-            print(f"⚠️  Skipping game {gid}: {e}")
+    player_rows, stat_rows = [], []
+    # fetches run in worker threads; rows are written here (sqlite is single-writer)
+    boxes = fetch_boxscores(game_ids, sleep_secs=sleep_secs, timeout=timeout, max_workers=max_workers)
+    for idx, (gid, box, err) in enumerate(boxes, 1):
+        if err is not None:
+            print(f"⚠️  Skipping game {gid}: {err}")
             continue
 
         for side in ("home", "away"):
@@ -110,23 +115,22 @@ def load_player_game_stats(start_ymd: str, end_ymd: str, sleep_secs: float = 0.1
             team_info = team_node.get("team") or {}
             team_id = team_info.get("id")
             players = (team_node.get("players") or {})
-            for _, node in players.items():
-                person = node.get("person") or {}
-                pid = person.get("id")
-                if not pid:
-                    continue
-                if team_id:
-                    upsert_min_player(cur, person, team_id)
-                line = extract_batting(node)
-                if any_batting(line):
-                    insert_row(cur, gid, pid, line)
-                    total += 1
-
-        if idx % 25 == 0:
-            conn.commit()
-        time.sleep(sleep_secs)
+            nodes = [node for node in players.values() if (node.get("person") or {}).get("id")]
+            if team_id:
+                player_rows.extend(
+                    (node["person"]["id"], node["person"].get("fullName", ""), team_id) for node in nodes
+                )
+            stats = extract_batting(nodes)
+            keep = any_batting(stats)
+            pids = np.fromiter((node["person"]["id"] for node in nodes), dtype=np.int64, count=len(nodes))[keep]
+            stats = stats[keep]
+            stat_rows.extend(zip(repeat(gid), pids.tolist(), *stats.T.tolist()))
+            total += len(pids)
 
-    conn.commit()
+        if idx % FLUSH_EVERY == 0:
+            flush(conn, player_rows, stat_rows)
+
+    flush(conn, player_rows, stat_rows)
     conn.close()
     print(f"✅ Upserted {total} player-game batting rows across {len(game_ids)} games")
 
@@ -1,21 +1,52 @@
 # src/load_players.py
-import sqlite3
+import json
+import os
 import statsapi
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable
 
-DB_PATH = 'data/mlb_stats.db'
+from db import get_conn
 
-def get_player_info(player_id: int) -> Optional[Dict[str, Any]]:
-    """Fetch extra info (like birthdate) from the API's 'people' endpoint."""
+INFO_CACHE_PATH = Path('data/players_info_cache.json')  # player_id -> {'birthDate': ...} across runs
+PEOPLE_CHUNK = 100  # ids per 'people' request
+
+def load_info_cache() -> Dict[int, Dict[str, Any]]:
+    if not INFO_CACHE_PATH.exists():
+        return {}
     try:
-        data = statsapi.get('people', {'personIds': player_id})
-        people = data.get('people', [])
-        return people[0] if people else None
-    except Exception:
-        return None
-
-def upsert_player(cur, player, team_id: int):
-    """Insert/update a single player."""
+        return {int(pid): info for pid, info in json.loads(INFO_CACHE_PATH.read_text()).items()}
+    except (OSError, ValueError):
+        return {}
+
+def save_info_cache(info_by_id: Dict[int, Dict[str, Any]]):
+    # write a sibling temp file and swap it in, so a crash never leaves truncated JSON behind
+    tmp = INFO_CACHE_PATH.with_name(f"{INFO_CACHE_PATH.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({str(pid): info for pid, info in info_by_id.items()}))
+    os.replace(tmp, INFO_CACHE_PATH)
+
+def get_players_info(player_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch extra info (like birthdate) from the API's 'people' endpoint,
+    PEOPLE_CHUNK comma-separated ids per request. Ids already in the on-disk cache are not refetched.
+    """
+    info_by_id = load_info_cache()
+    missing = [pid for pid in dict.fromkeys(player_ids) if pid and pid not in info_by_id]
+
+    for i in range(0, len(missing), PEOPLE_CHUNK):
+        chunk = missing[i:i + PEOPLE_CHUNK]
+        try:
+            data = statsapi.get('people', {'personIds': ','.join(map(str, chunk))})
+        except Exception:
+            continue
+        for person in data.get('people', []):
+            info_by_id[person['id']] = {'birthDate': person.get('birthDate')}
+
+    if missing:
+        save_info_cache(info_by_id)
+    return info_by_id
+
+def player_row(player, team_id: int, info_by_id: Dict[int, Dict[str, Any]]):
+    """Build the (player_id, name, team_id, position, birthdate) row for a roster entry."""
     # roster returns like: {'person': {'id': 123, 'fullName': '...'}, 'position': {'abbreviation': '...'}, ...}
     person = player.get('person', {})
     player_id = person.get('id')
@@ -24,11 +55,15 @@ def upsert_player(cur, player, team_id: int):
 
     # (Optional) Enrich with birthdate
     birthdate = None
-    info = get_player_info(player_id)
+    info: Optional[Dict[str, Any]] = info_by_id.get(player_id)
     if info:
         birthdate = info.get('birthDate')
 
-    cur.execute("""
+    return (player_id, name, team_id, position, birthdate)
+
+def upsert_players(cur, rows):
+    """Insert/update players from player_row() tuples."""
+    cur.executemany("""
         INSERT INTO players (player_id, name, team_id, position, birthdate)
         VALUES (?, ?, ?, ?, ?)
         ON CONFLICT(player_id) DO UPDATE SET
@@ -36,27 +71,31 @@ def upsert_player(cur, player, team_id: int):
             team_id=excluded.team_id,
             position=excluded.position,
             birthdate=COALESCE(excluded.birthdate, players.birthdate)
-    """, (player_id, name, team_id, position, birthdate))
+    """, rows)
 
 def load_players_for_all_teams():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cur = conn.cursor()
 
     # get team_ids already stored
     cur.execute("SELECT team_id FROM teams")
     team_ids = [row[0] for row in cur.fetchall()]
 
-    total = 0
-    for tid in team_ids:
-        # active roster
-        roster = statsapi.get('team_roster', {'teamId': tid, 'rosterType': 'active'}).get('roster', [])
-        for p in roster:
-            upsert_player(cur, p, tid)
-            total += 1
+    # active rosters first, so birthdates can be fetched in a few batched calls
+    rosters = {
+        tid: statsapi.get('team_roster', {'teamId': tid, 'rosterType': 'active'}).get('roster', [])
+        for tid in team_ids
+    }
+    info_by_id = get_players_info(
+        (p.get('person') or {}).get('id') for roster in rosters.values() for p in roster
+    )
+
+    rows = [player_row(p, tid, info_by_id) for tid, roster in rosters.items() for p in roster]
 
+    upsert_players(cur, rows)
     conn.commit()
     conn.close()
-    print(f"✅ Upserted {total} players across {len(team_ids)} teams")
+    print(f"✅ Upserted {len(rows)} players across {len(team_ids)} teams")
 
 if __name__ == "__main__":
     load_players_for_all_teams()
@@ -1,32 +1,26 @@
-import sqlite3
 import statsapi
 
-DB_PATH = 'data/mlb_stats.db'
+from db import get_conn
 
-def insert_team(team):
-    """Insert a single team into the teams table."""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-
-    cur.execute("""
+def insert_teams(cur, teams):
+    """Insert teams into the teams table (existing rows are left alone)."""
+    cur.executemany("""
         INSERT OR IGNORE INTO teams (team_id, name, abbreviation, location)
         VALUES (?, ?, ?, ?)
-    """, (
-        team['id'],
-        team['name'],
-        team['abbreviation'],
-        team['locationName']
-    ))
-
-    conn.commit()
-    conn.close()
+    """, [
+        (team['id'], team['name'], team['abbreviation'], team['locationName'])
+        for team in teams
+    ])
 
 def load_teams():
     """Fetch all MLB teams and insert them into the DB."""
     teams = statsapi.get('teams', {'sportId': 1})['teams']  # sportId=1 is MLB
 
-    for team in teams:
-        insert_team(team)
+    conn = get_conn()
+    cur = conn.cursor()
+    insert_teams(cur, teams)
+    conn.commit()
+    conn.close()
 
     print(f"✅ Inserted {len(teams)} teams into the database.")
 